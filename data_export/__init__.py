@@ -0,0 +1,3 @@
+"""Utilities for exporting data into files of various formats."""
+
+BUFFER_SIZE = 64 * 1024  # The size, in bytes, of the export files' write buffers
@@ -1,17 +1,40 @@
 """Utilities for exporting data into JSON files."""
 
 import json
+from typing import Optional
+from data_export import BUFFER_SIZE
 
-def export(items: list[any], path: str) -> None:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def export(items: list[any], path: str, indent: Optional[int] = None) -> None:
     """Export a list of items into a JSON file. If the file at `path` already exists, it will be
     overwritten!
 
+    The items are encoded with orjson_, if it's available and supports the requested indentation (it
+    only supports 2 spaces), and with the standard library's `json` module otherwise. In the latter
+    case the JSON string is encoded and streamed into the file chunk by chunk, rather than being
+    built in memory beforehand.
+
+    .. _orjson: https://github.com/ijl/orjson
+
     :param items: The list of items.
     :type items: list
     :param path: The path to the file to write the JSON string to.
     :type path: str
+    :param indent: The number of spaces to indent the JSON with, defaults to `None`. If left at
+    `None`, compact JSON, with no whitespace between its elements, is written.
+    :type indent: int, optional
     """
 
-    json_ = json.dumps(items, indent=4)
-    with open(path, 'wt', encoding='utf-8') as file:
-        file.write(json_)
+    with open(path, 'wb', buffering=BUFFER_SIZE) as file:
+        if orjson is not None and indent in (None, 2):
+            # orjson is a C extension, whose members pylint can't see
+            # pylint: disable-next=no-member
+            file.write(orjson.dumps(items, option=orjson.OPT_INDENT_2 if indent else None))
+        else:
+            separators = (',', ':') if indent is None else None
+            encoder = json.JSONEncoder(indent=indent, separators=separators, ensure_ascii=False)
+            file.writelines(chunk.encode('utf-8') for chunk in encoder.iterencode(items))
@@ -1,5 +1,21 @@
 """Utilities for exporting data into plain text files."""
 
+from typing import Iterator
+from data_export import BUFFER_SIZE
+
+def _lines(items: list[any]) -> Iterator[bytes]:
+    """Yield the items of a list as UTF-8 encoded lines of text, one at a time. Each item, except
+    the first one, is preceded by a line break.
+
+    :param items: The list of items.
+    :type items: list
+    :return: An iterator over the encoded lines of text.
+    :rtype: Iterator[bytes]
+    """
+
+    for i, item in enumerate(items):
+        yield (f'\n{item}' if i else f'{item}').encode('utf-8')
+
 def export(items: list[any], path: str) -> None:
     """Export a list of items into a plain text (.txt) file. Each item of the list will be placed on
     a separate line. If the file at `path` already exists, it will be overwritten!
@@ -10,5 +26,5 @@ def export(items: list[any], path: str) -> None:
     :type path: str
     """
 
-    with open(path, 'wt', encoding='utf-8') as file:
-        file.write('\n'.join(items))
+    with open(path, 'wb', buffering=BUFFER_SIZE) as file:
+        file.writelines(_lines(items))
@@ -1,60 +1,27 @@
 """Utilities for exporting data into XML files."""
 
-import xml.etree.ElementTree as ET
+from data_export import BUFFER_SIZE
 
-def _xml_element(tree: ET.ElementTree, data: any, tagname: str) -> None:
-    """Construct an XML element around data and insert it into a XML tree.
+_XML_DECLARATION = b"<?xml version='1.0' encoding='utf-8'?>\n"
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})  # Text content escapes
 
-    :param tree: The element tree to place the element into.
-    :type tree: ET.ElementTree
-    :param data: Data to wrap with a XML element.
-    :type data: any
-    :param tagname: The desired name of the element.
-    :type tagname: str
-    """
-
-    tree.start(tagname, {})
-    tree.data(str(data))
-    tree.end(tagname)
-
-def _xml_list(root_el_name: str, child_el_name: str, items: list[any]) -> ET.ElementTree:
-    """Express a list of items as XML.
-
-    :param root_el_name: The name of the root XML element.
-    :type root_el_name: str
-    :param child_el_name: The name of each child elements.
-    :type child_el_name: str
-    :param items: The name of the root XML element.
-    :type items: list
-    :return: The XML structure representing the list of `items`.
-    :type root_el_name: ET.ElementTree
-    """
-
-    tree = ET.TreeBuilder()
-    tree.start(root_el_name, {})
-    for item in items:
-        _xml_element(tree, item, tagname=child_el_name)
-    tree.end(root_el_name)
-    element = tree.close()
-    return _pretty_xml(element)
-
-def _pretty_xml(element: ET.Element) -> ET.ElementTree:
-    """Return a prettified (indented) XML.
+def export(root_el_name: str, child_el_name: str, items: list[any], path: str,
+           pretty: bool = False) -> None:
+    """Export a list of items into a XML file. If the file at `path` already exists, it will be
+    overwritten!
 
-    :param element: An XML element, usually a root element.
-    :type element: ET.Element
-    :return: A prettified version of `element`. If `element` is already prettified it will be
-    unchanged.
-    :rtype: ET.ElementTree
-    """
+    No intermediate element tree is built, the XML is formatted into a list of byte fragments which
+    are then written out in one go. The items' text is only escaped if any of them contains XML
+    special characters. By default the elements are written one after the other, with no
+    whitespace in between. A prettified XML has each child element on a separate, indented line:
 
-    xml = ET.ElementTree(element)
-    ET.indent(xml)
-    return xml
+    ::
 
-def export(root_el_name: str, child_el_name: str, items: list[any], path: str) -> None:
-    """Export a list of items into a XML file. If the file at `path` already exists, it will be
-    overwritten!
+        <?xml version='1.0' encoding='utf-8'?>
+        <Items>
+          <Item>Item 1</Item>
+          <Item>Item 2</Item>
+        </Items>
 
     :param root_el_name: The name of the root XML element.
     :type root_el_name: str
@@ -64,6 +31,17 @@ def export(root_el_name: str, child_el_name: str, items: list[any], path: str) -
     :type items: list
     :param path: The path to the file to write the XML to.
     :type path: str
+    :param pretty: Whether to prettify (indent) the XML, defaults to `False`.
+    :type pretty: bool
     """
 
-    _xml_list(root_el_name, child_el_name, items).write(path, encoding='utf-8')
+    texts = [str(item) for item in items]
+    if any('&' in text or '<' in text or '>' in text for text in texts):
+        texts = [text.translate(_XML_ESCAPE) for text in texts]
+    indent, newline = ('  ', '\n') if pretty else ('', '')
+    fragments = [_XML_DECLARATION, f'<{root_el_name}>{newline}'.encode('utf-8')]
+    fragments.extend(f'{indent}<{child_el_name}>{text}</{child_el_name}>{newline}'.encode('utf-8')
+                     for text in texts)
+    fragments.append(f'</{root_el_name}>'.encode('utf-8'))
+    with open(path, 'wb', buffering=BUFFER_SIZE) as file:
+        file.writelines(fragments)
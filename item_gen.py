@@ -1,12 +1,40 @@
 """Generate a number of random strings to use as items for the shuffler. Used mainly for development
-and testing purposes."""
+and testing purposes.
+
+If numba_ (and NumPy) is installed, the strings' digits are generated by a JIT-compiled, parallel
+kernel, which pays off for large numbers of strings. Note that the kernel draws from numba's own
+random number generator, so seeding Python's `random` module (``random.seed()``) makes no difference
+to the generated strings then.
+
+.. _numba: https://numba.pydata.org/
+"""
 
 import random
 import sys
-import os
+from data_export import BUFFER_SIZE
+
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+_DIGITS = '0123456789'
+_CHUNK_SIZE = 10_000  # The number of strings the command line tool generates at a time
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _fill_digits(out: 'np.ndarray') -> None:
+        """Fill a 2D array of bytes with the ASCII codes of random digits.
 
+        :param out: The array to fill, one row per string.
+        :type out: np.ndarray
+        """
 
-_DIGITS = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+        for i in prange(out.shape[0]):
+            for j in range(out.shape[1]):
+                out[i, j] = 48 + np.random.randint(0, 10)  # 48 is the ASCII code of '0'
 
 def _str(length: int) -> str:
     """Generate a random string with `length`.
@@ -17,7 +45,7 @@ def _str(length: int) -> str:
     :rtype: str
     """
 
-    return ''.join(str(random.choice(_DIGITS)) for _ in range(length))
+    return ''.join(random.choices(_DIGITS, k=length))
 
 def random_strs(num: int, length: int) -> list[str]:
     """Return a list of random strings.
@@ -30,9 +58,19 @@ def random_strs(num: int, length: int) -> list[str]:
     :rtype: list[str]
     """
 
-    return [_str(length) for _ in range(num)]
+    if not length:
+        return [''] * num
+    if njit is not None:
+        buffer = np.empty((num, length), dtype=np.uint8)
+        _fill_digits(buffer)
+        return [str_.decode('ascii') for str_ in buffer.view(f'S{length}').ravel().tolist()]
+    digits = _str(num * length)  # All strings' digits, generated at once
+    return [digits[i:i + length] for i in range(0, len(digits), length)]
 
 if __name__ == '__main__':
-    STRS = os.linesep.join(random_strs(num=int(sys.argv[1]), length=int(sys.argv[2])))
-    with open('items.txt', 'wt', encoding='utf-8') as file:
-        file.write(STRS)
+    NUM, LENGTH = int(sys.argv[1]), int(sys.argv[2])
+    # Generate and write the strings in chunks, so they never all sit in memory at once
+    with open('items.txt', 'wt', encoding='utf-8', buffering=BUFFER_SIZE) as file:
+        for start in range(0, NUM, _CHUNK_SIZE):
+            file.writelines(f'{str_}\n'
+                            for str_ in random_strs(min(_CHUNK_SIZE, NUM - start), LENGTH))
@@ -9,12 +9,31 @@ from data_export.xml   import export as export_xml
 from data_export.json  import export as export_json
 
 class State:
-    """A container for an app's state."""
-
-    def __init__(self, **kwargs):
+    """A container for an app's state. Each state item is an attribute of the container, e.g.
+    ``state.interval``. Items that have not been set read as `None`."""
+
+    __slots__ = ('shuffle_list', 'shuffle_list_filepath', 'picked', 'interval', 'value',
+                 'shuffle_btn', 'shuffling_in_progress', 'picked_items_container')
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, *, shuffle_list: Optional[list[str]] = None,
+                 shuffle_list_filepath: Optional[str] = None,
+                 picked: Optional[list[str]] = None,
+                 interval: Optional[int] = None,
+                 value: Optional[ui.StrBinding] = None,
+                 shuffle_btn: Optional[ui.Button] = None,
+                 shuffling_in_progress: Optional[bool] = None,
+                 picked_items_container: Optional[ui.List] = None):
         """Create a new app state container."""
 
-        self.items = kwargs
+        self.shuffle_list = shuffle_list
+        self.shuffle_list_filepath = shuffle_list_filepath
+        self.picked = picked
+        self.interval = interval
+        self.value = value
+        self.shuffle_btn = shuffle_btn
+        self.shuffling_in_progress = shuffling_in_progress
+        self.picked_items_container = picked_items_container
 
     def get(self, key: str) -> any:
         """Return the value of an app's state item or `None` if no such item exists in the state
@@ -26,7 +45,7 @@ class State:
         :rtype: any
         """
 
-        return self.items.get(key)
+        return getattr(self, key, None)
 
     def set(self, key: str, value: any) -> None:
         """Set a state item to a certain value.
@@ -38,9 +57,9 @@ class State:
         """
 
         if callable(value):
-            value(self.items[key])
+            value(getattr(self, key))
         else:
-            self.items[key] = value
+            setattr(self, key, value)
 
 class Application(ui.Frame, ui.Responsive):
     """The GUI app."""
@@ -61,16 +80,15 @@ class Application(ui.Frame, ui.Responsive):
             ('XML', self._export_xml),
             ('JSON', self._export_json)
         )
-        self.state = State(**{
-            'shuffle_list': [],
-            'shuffle_list_filepath': None,
-            'picked': [],
-            'interval': 50,
-            'value': ui.StrBinding('Choose an items file'),
-            'shuffle_btn': None,
-            'shuffling_in_progress': False,
-            'picked_items_container': None,  # ui.List
-        })
+        self._export_procs = {name.lower(): proc for name, proc in self.export_formats}
+        self.state = State(shuffle_list=[],
+                           shuffle_list_filepath=None,
+                           picked=[],
+                           interval=50,
+                           value=ui.StrBinding('Choose an items file'),
+                           shuffle_btn=None,
+                           shuffling_in_progress=False,
+                           picked_items_container=None)
         self._setup_layout(minwidth=520, minheight=110)
         self.grid(sticky=ui.FULL_STRETCH)
         widgets = self._create_widgets()
@@ -135,7 +153,7 @@ class Application(ui.Frame, ui.Responsive):
         """Create the app's GUI."""
 
         # The currently visible item
-        current_item = ui.widget(ui.Label, self, textvariable=self.state.get('value'),
+        current_item = ui.widget(ui.Label, self, textvariable=self.state.value,
                                  font=('Futura', 20),
                                  grid={'columnspan': 4, 'sticky': ui.LEFT + ui.TOP})
         # The 'Import' button
@@ -147,7 +165,7 @@ class Application(ui.Frame, ui.Responsive):
         # The 'Start/Stop' button
         start_stop_button = ui.widget(ui.Button, self, text='Start', command=self._toggle_shuffler,
                                       grid={'row': 1, 'column': 2, 'sticky': ui.H_STRETCH})
-        self.state.set('shuffle_btn', start_stop_button)
+        self.state.shuffle_btn = start_stop_button
         # The 'Pick (item)' button
         pick_button = ui.widget(ui.Button, self, text='Pick', command=self._pick_item,
                                 grid={'row': 1, 'column': 3, 'sticky': ui.H_STRETCH})
@@ -160,11 +178,10 @@ class Application(ui.Frame, ui.Responsive):
         ui.widget(ui.Frame, self, width=10, grid={'column': 4})  # 10px vertical spacer
         # The list of picked items
         picked_items_list = ui.List(
-            parent=self, items=self.state.get('picked'), bg='lightgrey', height=5, relief=ui.SUNKEN,
+            parent=self, items=self.state.picked, bg='lightgrey', height=5, relief=ui.SUNKEN,
             grid={'row': 0, 'column': 5, 'rowspan': 3, 'sticky': ui.FULL_STRETCH},
             scroll_grid={'rowspan': 3})
-        self.state.set('picked_items_container', picked_items_list)
-        self.bind('<Configure>', lambda _: self._rescale())
+        self.state.picked_items_container = picked_items_list
         return {
             'current_item': current_item,
             'import_button': import_button,
@@ -182,15 +199,15 @@ class Application(ui.Frame, ui.Responsive):
         def start_shuffling():
             """Start the shuffling process."""
 
-            random.shuffle(self.state.get('shuffle_list'))
+            random.shuffle(self.state.shuffle_list)
             self._toggle_shuffle_state('on')
             i = 0
             self._start_item_flash_loop(i)
 
-        if not self.state.get('shuffle_list') and not self.state.get('shuffle_list_filepath'):
+        if not self.state.shuffle_list and not self.state.shuffle_list_filepath:
             self._load_shuffle_list(fresh=False)
-        if not self.state.get('shuffling_in_progress'):
-            if not self.state.get('shuffle_list'):
+        if not self.state.shuffling_in_progress:
+            if not self.state.shuffle_list:
                 self._reset()
             start_shuffling()
             return
@@ -215,30 +232,30 @@ class Application(ui.Frame, ui.Responsive):
         """
 
         if state == 'on':
-            self.state.set('shuffling_in_progress', True)
+            self.state.shuffling_in_progress = True
             if isinstance(update_btn_label, bool) and update_btn_label:
-                self.state.get('shuffle_btn')['text'] = 'Stop'
+                self.state.shuffle_btn['text'] = 'Stop'
             elif isinstance(update_btn_label, str):
-                self.state.get('shuffle_btn')['text'] = update_btn_label
+                self.state.shuffle_btn['text'] = update_btn_label
         elif state == 'off':
-            self.state.set('shuffling_in_progress', False)
+            self.state.shuffling_in_progress = False
             if isinstance(update_btn_label, bool) and update_btn_label:
-                self.state.get('shuffle_btn')['text'] = 'Start'
+                self.state.shuffle_btn['text'] = 'Start'
             elif isinstance(update_btn_label, str):
-                self.state.get('shuffle_btn')['text'] = update_btn_label
+                self.state.shuffle_btn['text'] = update_btn_label
         if btn_state:
-            self.state.get('shuffle_btn')['state'] = btn_state
+            self.state.shuffle_btn['state'] = btn_state
 
     def _pick_item(self) -> None:
         """'Pick' the currently visible item, put it on a list and remove it from the shuffle list.
         """
 
-        if self.state.get('shuffle_list') and self.state.get('shuffling_in_progress'):
+        if self.state.shuffle_list and self.state.shuffling_in_progress:
             self._toggle_shuffle_state('off', update_btn_label=False)
-            self._transfer_item_to_picked_list(self.state.get('value').get())
-            if not self.state.get('shuffle_list'):  # Shuffle list is empty
-                self.state.get('value').set('No more items. Reset/Restart.')
-                ui.config(widget_=self.state.get('shuffle_btn'), opts={'text': 'Restart'})
+            self._transfer_item_to_picked_list(self.state.value.get())
+            if not self.state.shuffle_list:  # Shuffle list is empty
+                self.state.value.set('No more items. Reset/Restart.')
+                ui.config(widget_=self.state.shuffle_btn, opts={'text': 'Restart'})
                 return
             self._toggle_shuffle_state('on', update_btn_label=False)
 
@@ -249,10 +266,12 @@ class Application(ui.Frame, ui.Responsive):
         :type item_: str
         """
 
-        self.state.set('shuffle_list',
-                       [item for item in self.state.get('shuffle_list') if item != item_])
-        self.state.get('picked').append(item_)
-        self.state.get('picked_items_container').add(item_)
+        try:
+            self.state.shuffle_list.remove(item_)  # Items are unique, remove in place
+        except ValueError:
+            pass
+        self.state.picked.append(item_)
+        self.state.picked_items_container.add(item_)
 
     def _start_item_flash_loop(self, i: int) -> None:
         """Start a loop in which items from the shuffle list are shown briefly (flashed) on-screen
@@ -262,16 +281,15 @@ class Application(ui.Frame, ui.Responsive):
         :type i: int
         """
 
-        if self.state.get('shuffling_in_progress'):
-            try:
-                self.state.set('value', lambda it: it.set(self.state.get('shuffle_list')[i]))
-            except IndexError:
-                i = 0
-            else:
-                i += 1 if i < len(self.state.get('shuffle_list')) - 1 else \
-                    -len(self.state.get('shuffle_list'))
-            if self.state.get('shuffling_in_progress'):
-                self.after(self.state.get('interval'), lambda: self._start_item_flash_loop(i))
+        if self.state.shuffling_in_progress:
+            shuffle_list = self.state.shuffle_list
+            count = len(shuffle_list)
+            if count:
+                i %= count  # The shuffle list might have shrunk since the last flash
+                self.state.value.set(shuffle_list[i])
+                i = (i + 1) % count
+            if self.state.shuffling_in_progress:
+                self.after(self.state.interval, self._start_item_flash_loop, i)
 
     def _load_shuffle_list(self, fresh: bool = True) -> None:
         """Get the items for the shuffler from the content of the file at path. Each "item" from
@@ -293,21 +311,22 @@ class Application(ui.Frame, ui.Responsive):
         """
 
         if fresh:
-            self.state.set('shuffle_list_filepath', ui.file_chooser())
+            self.state.shuffle_list_filepath = ui.file_chooser()
         else:
-            if not self.state.get('shuffle_list_filepath'):
-                self.state.set('shuffle_list_filepath', ui.file_chooser())
-        if self.state.get('shuffle_list_filepath'):
-            with open(self.state.get('shuffle_list_filepath'), encoding='utf-8') as file:
-                lines = [line.strip(' \n') for line in file.readlines()]
-                self.state.set('shuffle_list', list(set(filter(lambda line: line.strip(), lines))))
-                self.state.set('value', lambda it: it.set(f'{len(self.state.get("shuffle_list"))} '
-                                                           'items loaded.'))
+            if not self.state.shuffle_list_filepath:
+                self.state.shuffle_list_filepath = ui.file_chooser()
+        if self.state.shuffle_list_filepath:
+            with open(self.state.shuffle_list_filepath, encoding='utf-8') as file:
+                lines = (line.strip(' \n') for line in file)
+                # Drop blank and duplicate lines, keeping the file's order
+                self.state.shuffle_list = list(dict.fromkeys(
+                    line for line in lines if line.strip()))
+                self.state.value.set(f'{len(self.state.shuffle_list)} items loaded.')
 
     def _export_picked(self) -> None:
         """Export the list of picked items to a file."""
 
-        if self.state.get('picked'):
+        if self.state.picked:
             path = ui.file_saver()
             proc = self._get_export_proc(path)
             if proc:
@@ -323,7 +342,7 @@ class Application(ui.Frame, ui.Responsive):
         returned.
 
         The list of supported formats along with their procedures is stored in this class's
-        ``export_formats``.
+        ``export_formats``, they are looked up by extension in an index built off of it.
 
         :param path: The path to the export file.
         :type path: str
@@ -331,10 +350,7 @@ class Application(ui.Frame, ui.Responsive):
         :rtype: Optional[callable]
         """
 
-        _, file = os.path.split(path)
-        ext = os.path.splitext(file)[1].lower().strip('.')
-        procs = list(filter(lambda it: it[0].lower() == ext, self.export_formats))
-        return procs[0][1]
+        return self._export_procs.get(os.path.splitext(path)[1][1:].lower())
 
     def _export_txt(self, path: str) -> None:
         """Export the picked items into a .txt file.
@@ -343,7 +359,7 @@ class Application(ui.Frame, ui.Responsive):
         :type path: str
         """
 
-        export_plain(items=self.state.get('picked'), path=path)
+        export_plain(items=self.state.picked, path=path)
 
     def _export_xml(self, path: str) -> None:
         """Export the picked items into a XML file.
@@ -353,7 +369,7 @@ class Application(ui.Frame, ui.Responsive):
         """
 
         export_xml(root_el_name='Items', child_el_name='Item',
-                   items=self.state.get('picked'), path=path)
+                   items=self.state.picked, path=path)
 
     def _export_json(self, path: str) -> None:
         """Export the picked items into a .json file.
@@ -362,30 +378,29 @@ class Application(ui.Frame, ui.Responsive):
         :type path: str
         """
 
-        export_json(items=self.state.get('picked'), path=path)
+        export_json(items=self.state.picked, path=path)
 
     def _reset(self) -> None:
         """Reset the shuffling process. Stops the shuffler and clears the list of picked items."""
 
-        if self.state.get('picked'):
+        if self.state.picked:
             restart_shuffle = False
-            if self.state.get('shuffling_in_progress'):
+            if self.state.shuffling_in_progress:
                 self._toggle_shuffle_state('off')
                 restart_shuffle = True
-            self.state.set('shuffle_list', self.state.get('shuffle_list') +
-                                           self.state.get('picked'))
-            self.state.set('picked', [])
-            self.state.get('picked_items_container').remove_all()
+            self.state.shuffle_list = self.state.shuffle_list + self.state.picked
+            self.state.picked = []
+            self.state.picked_items_container.remove_all()
             if restart_shuffle:
                 self._toggle_shuffle_state('on')
             else:
-                ui.config(self.state.get('shuffle_btn'), opts={'text': 'Start'})
-            self.state.get('value').set('Shuffler reset.')
+                ui.config(self.state.shuffle_btn, opts={'text': 'Start'})
+            self.state.value.set('Shuffler reset.')
 
 def main() -> None:
     """Start the application."""
 
-    if __name__ == '__main__':
-        Application().start()
+    Application().start()
 
-main()
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,27 @@
 
 import unittest
 from unittest.mock import Mock, patch, mock_open
+from data_export import BUFFER_SIZE
 from data_export.json import export
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _written(open_: Mock) -> bytes:
+    """Return everything written into a mocked file, whether with `write` or `writelines`.
+
+    :param open_: The mocked `open` function.
+    :type open_: Mock
+    :return: The written bytes.
+    :rtype: bytes
+    """
+
+    file = open_.return_value
+    return b''.join([*(call.args[0] for call in file.write.call_args_list),
+                     *(b''.join(call.args[0]) for call in file.writelines.call_args_list)])
+
 class TestJsonDataExport(unittest.TestCase):
     """Test the functioning of the data_export/json.py module."""
 
@@ -14,7 +33,58 @@ class TestJsonDataExport(unittest.TestCase):
         items = ['Item 1', 'Item 2', 'Item 3']
         export(items, path='/path/to/a/file.json')
         args, kwargs = open_.call_args
+        self.assertEqual(('/path/to/a/file.json', 'wb'), args)
+        self.assertEqual({'buffering': BUFFER_SIZE}, kwargs)
+        self.assertEqual(b'["Item 1","Item 2","Item 3"]', _written(open_))
+
+    @unittest.skipUnless(orjson, 'orjson is not installed')
+    @patch("builtins.open", new_callable=mock_open)
+    def test_export_with_orjson(self, open_: Mock) -> None:
+        """Confirm that a list of items is encoded by orjson, when it's available, and written
+        into a .json file at once."""
+
+        items = ['Item 1', 'Item 2', 'Item 3']
+        export(items, path='/path/to/a/file.json')
+        file_write_args, _ = open_.return_value.write.call_args
+        self.assertEqual((b'["Item 1","Item 2","Item 3"]',), file_write_args)
+
+    @patch('data_export.json.orjson', None)
+    @patch("builtins.open", new_callable=mock_open)
+    def test_export_indented(self, open_: Mock) -> None:
+        """Confirm that a list of items is exported into a .json file with a certain indentation."""
+
+        items = ['Item 1', 'Item 2', 'Item 3']
+        export(items, path='/path/to/a/file.json', indent=2)
+        self.assertEqual(b'[\n  "Item 1",\n  "Item 2",\n  "Item 3"\n]', _written(open_))
+        open_.reset_mock()
+        export(items, path='/path/to/a/file.json', indent=4)
+        self.assertEqual(b'[\n    "Item 1",\n    "Item 2",\n    "Item 3"\n]', _written(open_))
+
+    @unittest.skipUnless(orjson, 'orjson is not installed')
+    @patch("builtins.open", new_callable=mock_open)
+    def test_export_indented_with_orjson(self, open_: Mock) -> None:
+        """Confirm that a list of items is encoded by orjson when indented with 2 spaces, and by the
+        standard library's `json` module when indented with any other number of spaces."""
+
+        items = ['Item 1', 'Item 2', 'Item 3']
+        export(items, path='/path/to/a/file.json', indent=2)
         file_write_args, _ = open_.return_value.write.call_args
-        self.assertEqual(('/path/to/a/file.json', 'wt'), args)
-        self.assertEqual({'encoding': 'utf-8'}, kwargs)
-        self.assertEqual(('[\n    "Item 1",\n    "Item 2",\n    "Item 3"\n]',), file_write_args)
+        self.assertEqual((b'[\n  "Item 1",\n  "Item 2",\n  "Item 3"\n]',), file_write_args)
+        open_.reset_mock()
+        export(items, path='/path/to/a/file.json', indent=4)
+        self.assertEqual(0, open_.return_value.write.call_count)
+        self.assertEqual(b'[\n    "Item 1",\n    "Item 2",\n    "Item 3"\n]', _written(open_))
+
+    @patch('data_export.json.orjson', None)
+    @patch("builtins.open", new_callable=mock_open)
+    def test_export_without_orjson(self, open_: Mock) -> None:
+        """Confirm that a list of items is exported into a .json file when orjson is not available.
+        """
+
+        items = ['Item 1', 'Item 2', 'Item 3']
+        export(items, path='/path/to/a/file.json')
+        args, kwargs = open_.call_args
+        self.assertEqual(('/path/to/a/file.json', 'wb'), args)
+        self.assertEqual({'buffering': BUFFER_SIZE}, kwargs)
+        self.assertEqual(0, open_.return_value.write.call_count)  # Streamed, not written at once
+        self.assertEqual(b'["Item 1","Item 2","Item 3"]', _written(open_))
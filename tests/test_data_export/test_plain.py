@@ -2,6 +2,7 @@
 
 import unittest
 from unittest.mock import Mock, patch, mock_open
+from data_export import BUFFER_SIZE
 from data_export.plain import export
 
 class TestPlainTextDataExport(unittest.TestCase):
@@ -14,7 +15,7 @@ class TestPlainTextDataExport(unittest.TestCase):
         items = ['Item 1', 'Item 2', 'Item 3']
         export(items, path='/path/to/a/file.txt')
         args, kwargs = open_.call_args
-        file_write_args, _ = open_.return_value.write.call_args
-        self.assertEqual(('/path/to/a/file.txt', 'wt'), args)
-        self.assertEqual({'encoding': 'utf-8'}, kwargs)
-        self.assertEqual(('Item 1\nItem 2\nItem 3',), file_write_args)
+        file_writelines_args, _ = open_.return_value.writelines.call_args
+        self.assertEqual(('/path/to/a/file.txt', 'wb'), args)
+        self.assertEqual({'buffering': BUFFER_SIZE}, kwargs)
+        self.assertEqual(b'Item 1\nItem 2\nItem 3', b''.join(file_writelines_args[0]))
@@ -1,20 +1,48 @@
 """Test the data_export/xml.py module."""
 
 import unittest
-from unittest.mock import patch
-import xml.etree.ElementTree as ET
+from unittest.mock import Mock, patch, mock_open
+from data_export import BUFFER_SIZE
 from data_export.xml import export
 
 class TestXMLDataExport(unittest.TestCase):
     """Test the functioning of the data_export/xml.py module."""
 
-    # @patch('data_export.xml._xml_list')
-    @patch('data_export.xml.ET.ElementTree.write')
-    def test_export(self, write_element_tree: ET.ElementTree) -> None:
+    @patch("builtins.open", new_callable=mock_open)
+    def test_export(self, open_: Mock) -> None:
         """Confirm that a list of items is exported into a .xml file."""
 
         items = ['Item 1', 'Item 2', 'Item 3']
         export(root_el_name='Items', child_el_name='Item', items=items, path='/path/to/a/file.xml')
-        args, kwargs = write_element_tree.call_args
-        self.assertEqual(('/path/to/a/file.xml',), args)
-        self.assertEqual({'encoding': 'utf-8'}, kwargs)
+        args, kwargs = open_.call_args
+        file_writelines_args, _ = open_.return_value.writelines.call_args
+        self.assertEqual(('/path/to/a/file.xml', 'wb'), args)
+        self.assertEqual({'buffering': BUFFER_SIZE}, kwargs)
+        self.assertEqual(b"<?xml version='1.0' encoding='utf-8'?>\n"
+                         b'<Items><Item>Item 1</Item><Item>Item 2</Item><Item>Item 3</Item>'
+                         b'</Items>',
+                         b''.join(file_writelines_args[0]))
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_export_pretty(self, open_: Mock) -> None:
+        """Confirm that a list of items is exported into a prettified .xml file."""
+
+        items = ['Item 1', 'Item 2', 'Item 3']
+        export(root_el_name='Items', child_el_name='Item', items=items, path='/path/to/a/file.xml',
+               pretty=True)
+        file_writelines_args, _ = open_.return_value.writelines.call_args
+        self.assertEqual(b"<?xml version='1.0' encoding='utf-8'?>\n"
+                         b'<Items>\n'
+                         b'  <Item>Item 1</Item>\n'
+                         b'  <Item>Item 2</Item>\n'
+                         b'  <Item>Item 3</Item>\n'
+                         b'</Items>', b''.join(file_writelines_args[0]))
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_export_escapes_items(self, open_: Mock) -> None:
+        """Confirm that XML special characters in the items are escaped on export."""
+
+        export(root_el_name='Items', child_el_name='Item', items=['<A & B>'],
+               path='/path/to/a/file.xml')
+        file_writelines_args, _ = open_.return_value.writelines.call_args
+        self.assertIn(b'<Item>&lt;A &amp; B&gt;</Item>', file_writelines_args[0])
@@ -1,8 +1,15 @@
 """Test the app's (shuffle) item generation module."""
 
+import random
 import unittest
+from unittest.mock import patch
 import item_gen
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 class TestitemGenerator(unittest.TestCase):
     """Test the functioning of the (shuffle) items generation module."""
 
@@ -14,3 +21,28 @@ class TestitemGenerator(unittest.TestCase):
         self.assertEqual(5, len(strs[0]))
         self.assertEqual(5, len(strs[1]))
         self.assertEqual(5, len(strs[2]))
+
+    @patch('item_gen.njit', None)
+    def test_strings_of_digits_are_generated_without_numba(self) -> None:
+        """Confirm that random strings of digits are generated when numba is not available, in a
+        way that's reproducible by seeding Python's `random` module."""
+
+        random.seed(42)
+        strs = item_gen.random_strs(num=100, length=8)
+        self.assertEqual(100, len(strs))
+        self.assertTrue(all(len(str_) == 8 and str_.isdigit() for str_ in strs))
+        random.seed(42)
+        self.assertEqual(strs, item_gen.random_strs(num=100, length=8))
+
+    @unittest.skipUnless(numba, 'numba is not installed')
+    def test_strings_of_digits_are_generated_with_numba(self) -> None:
+        """Confirm that random strings of digits are generated by the numba kernel."""
+
+        strs = item_gen.random_strs(num=1000, length=12)
+        self.assertEqual(1000, len(strs))
+        self.assertTrue(all(len(str_) == 12 and str_.isdigit() for str_ in strs))
+
+    def test_empty_strings_are_generated_for_a_zero_length(self) -> None:
+        """Confirm that empty strings are generated when a zero length is requested."""
+
+        self.assertEqual(['', '', ''], item_gen.random_strs(num=3, length=0))
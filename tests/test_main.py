@@ -1,17 +1,18 @@
 """Test the app's entry module."""
 
+# Event handlers and their helpers are called directly, there's no display to drive them
+# pylint: disable=protected-access
+
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, mock_open, patch
 from main import Application, State, main as main_fn
 
 class TestMain(unittest.TestCase):
     """Test the functioning of the app's entry (`main.py`) module."""
 
-    @patch('main.__name__', '__main__')
     @patch('main.Application')
-    def test_app_main_func_starts_the_gui_app_when_main_module_is_invoked(self, app: Mock) -> None:
-        """Confirm that the app's `main()` function starts up the GUI app when the `main.py` module
-        is invoked (when `__name__ == '__main__'`)."""
+    def test_app_main_func_starts_the_gui_app(self, app: Mock) -> None:
+        """Confirm that the app's `main()` function starts up the GUI app."""
 
         main_fn()
         # Confirm that two calls of the Application class have been made
@@ -20,47 +21,47 @@ class TestMain(unittest.TestCase):
         # Confirm that the call to start the GUI app has been made
         self.assertEqual('().start', app.mock_calls[1][0])
 
-    @patch('main.__name__', '__non-main__')
-    @patch('main.Application')
-    def test_app_main_func_does_not_starts_the_gui_app_when_main_module_is_just_referenced(
-        self, app: Mock) -> None:
-        """Confirm that the app's `main()` function does not start up the GUI app when the `main.py`
-        module is just referenced (imported) (when `__name__ != '__main__'`)."""
-
-        main_fn()
-        self.assertEqual(0, len(app.mock_calls))
-
 class TestAppState(unittest.TestCase):
     """Test the functioning of an (app) `State`."""
 
     def test_a_value_is_retrieved_from_an_app_state(self) -> None:
         """Confirm that a value is retrieved from an (app) `State`."""
 
-        state = State(key1='value1')
-        self.assertEqual('value1', state.get('key1'))
+        state = State(interval=50)
+        self.assertEqual(50, state.get('interval'))
 
     def test_nothing_is_returned_for_a_non_existing_key_in_an_app_state(self) -> None:
         """Confirm that `None` is returned when trying to get a value by a non-existent key from an
         (app) `State`."""
 
-        state = State(key1='value1')
+        state = State(interval=50)
         self.assertIsNone(state.get('key2'))
 
     def test_an_app_state_invokes_a_callable_when_trying_to_set_an_item_to_a_value(self) -> None:
         """Confirm that an (app) `State` invokes a passed in callable in the process of setting one
         of its items to a certain value."""
 
-        state = State(key1='value1')
+        state = State(interval=50)
         setter = Mock()
-        state.set('key1', setter)
-        setter.assert_called_once_with('value1')
+        state.set('interval', setter)
+        setter.assert_called_once_with(50)
 
     def test_an_app_state_item_is_set_to_a_certain_value(self) -> None:
         """Confirm that an (app) `State`'s item is set to a certain value"""
 
-        state = State(key1='value1')
-        state.set('key1', 'value2')
-        self.assertEqual('value2', state.get('key1'))
+        state = State(interval=50)
+        state.set('interval', 100)
+        self.assertEqual(100, state.get('interval'))
+
+    def test_an_app_state_item_is_accessible_as_an_attribute(self) -> None:
+        """Confirm that an (app) `State`'s items are accessible as attributes, unset ones being
+        `None`."""
+
+        state = State(interval=50)
+        state.picked = ['Item 1']
+        self.assertEqual(50, state.interval)
+        self.assertEqual(['Item 1'], state.get('picked'))
+        self.assertIsNone(state.value)
 
 class TestApplication(unittest.TestCase):
     """Test the functioning of an `Application` instance."""
@@ -82,3 +83,60 @@ class TestApplication(unittest.TestCase):
         app = Application()
         app.start()
         main_loop.assert_called()
+
+    def test_items_are_flashed_in_sequence(self) -> None:
+        """Confirm that the item flash loop shows the shuffle list's items one after the other,
+        wrapping around at its end, and keeps its index within the list after it shrinks."""
+
+        app = Mock()
+        app.state = State(shuffle_list=['Item 1', 'Item 2', 'Item 3'], interval=50, value=Mock(),
+                          shuffling_in_progress=True)
+        i = 0
+        shown = []
+        for _ in range(4):
+            Application._start_item_flash_loop(app, i)
+            shown.append(app.state.value.set.call_args.args[0])
+            interval, _, i = app.after.call_args.args
+            self.assertEqual(50, interval)
+        self.assertEqual(['Item 1', 'Item 2', 'Item 3', 'Item 1'], shown)
+        self.assertEqual(1, i)
+        app.state.shuffle_list = ['Item 1']
+        Application._start_item_flash_loop(app, 2)
+        app.state.value.set.assert_called_with('Item 1')
+        self.assertEqual(0, app.after.call_args.args[2])
+
+    def test_items_stop_being_flashed_once_the_shuffling_stops(self) -> None:
+        """Confirm that the item flash loop doesn't go on once the shuffling is stopped."""
+
+        app = Mock()
+        app.state = State(shuffle_list=['Item 1'], interval=50, value=Mock(),
+                          shuffling_in_progress=False)
+        Application._start_item_flash_loop(app, 0)
+        app.state.value.set.assert_not_called()
+        app.after.assert_not_called()
+
+    def test_the_export_procedure_is_picked_by_the_file_extension(self) -> None:
+        """Confirm that the export procedure is picked by the export file's extension, regardless of
+        its case, and that none is picked for an unsupported or a missing extension."""
+
+        xml, json = Mock(), Mock()
+        app = Mock(_export_procs={'xml': xml, 'json': json})
+        for path, proc in (('/path/to/picked-items.XML', xml), ('/path/to/picked-items.json', json),
+                           ('/path/to/picked-items.foo', None), ('foo', None), ('', None)):
+            with self.subTest(path=path):
+                self.assertIs(proc, Application._get_export_proc(app, path))
+
+    @patch('ui.file_chooser', return_value='/path/to/items.txt')
+    @patch('builtins.open', new_callable=mock_open,
+           read_data='Item 2\nItem 1\n\nItem 2\n   \nItem 3\nItem 1\n')
+    def test_the_shuffle_list_is_loaded_from_a_file(self, open_: Mock, _file_chooser: Mock) -> None:
+        """Confirm that the shuffle list is loaded from a user-chosen file, dropping its blank and
+        duplicate lines while keeping the file's order, and that the number of loaded items is
+        shown."""
+
+        app = Mock()
+        app.state = State(shuffle_list=[], value=Mock())
+        Application._load_shuffle_list(app)
+        open_.assert_called_once_with('/path/to/items.txt', encoding='utf-8')
+        self.assertEqual(['Item 2', 'Item 1', 'Item 3'], app.state.shuffle_list)
+        app.state.value.set.assert_called_once_with('3 items loaded.')
@@ -0,0 +1,374 @@
+"""Test the app's UI module."""
+
+# Event handlers and their helpers are called directly, there's no display to drive them
+# pylint: disable=protected-access
+
+import asyncio
+import unittest
+from typing import Callable, Optional, Union
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
+from ui import (Bounds, Breakpoint, NamedList, Responsive, StyleSpec, UISpec, afile_chooser,
+                pump_asyncio)
+
+def _breakpoints() -> tuple[Breakpoint, ...]:
+    """Create the app's breakpoints, each with a spec of a mocked widget.
+
+    :return: The breakpoints, in ascending order.
+    :rtype: tuple[Breakpoint, ...]
+    """
+
+    return (Breakpoint('default', Bounds(0, 800), (UISpec(Mock(), {'font': ('Futura', 20)}),)),
+            Breakpoint('medium', Bounds(800, 1500), (UISpec(Mock(), {'font': ('Futura', 80)}),)),
+            Breakpoint('large', Bounds(1500, 3500), (UISpec(Mock(), {'font': ('Futura', 120)}),)))
+
+class _FakeBindings:
+    """A stand-in for tkinter's event bindings of a widget, that keeps their Tcl scripts the way Tk
+    does, one line per bound handler."""
+
+    def __init__(self) -> None:
+        """Initialize a new set of bindings."""
+
+        self.scripts = {}
+        self.handlers = {}
+
+    def bind(self, sequence: str, func: Union[Callable, str, None] = None,
+             add: Optional[str] = None) -> Optional[str]:
+        """Bind a handler, or a Tcl script, to an event sequence, or return the sequence's script.
+        """
+
+        if func is None:
+            return self.scripts.get(sequence, '')
+        if isinstance(func, str):
+            self.scripts[sequence] = func
+            return None
+        funcid = f'handler{len(self.handlers)}'
+        self.handlers[funcid] = func
+        line = f'if {{"[{funcid} %#]" == "break"}} break\n'
+        self.scripts[sequence] = (self.scripts.get(sequence, '') if add else '') + line
+        return funcid
+
+    def fire(self, sequence: str) -> None:
+        """Call the handlers bound to an event sequence."""
+
+        for funcid, func in self.handlers.items():
+            if funcid in self.scripts.get(sequence, ''):
+                func(Mock())
+
+def _texts(named_list: NamedList) -> list[str]:
+    """Return the texts last set on a virtual named list's (mocked) pool of item widgets.
+
+    :param named_list: The named list.
+    :type named_list: NamedList
+    :return: The item widgets' texts.
+    :rtype: list[str]
+    """
+
+    return [widget.__setitem__.call_args.args[1] for widget in named_list.item_widgets]
+
+def _named_list(test: unittest.TestCase, **kwargs: any) -> tuple[NamedList, _FakeBindings]:
+    """Create a named list without a display, by patching out its tkinter calls for the duration of
+    a test. The items' widgets are mocked.
+
+    :param test: The test to create the named list for.
+    :type test: unittest.TestCase
+    :param kwargs: Keyword arguments to pass onto the named list's constructor.
+    :type kwargs: any
+    :return: The named list, along with its event bindings.
+    :rtype: tuple[NamedList, _FakeBindings]
+    """
+
+    bindings = _FakeBindings()
+    patchers = (
+        patch('ui.tk.LabelFrame.__init__', return_value=None),
+        patch.multiple(NamedList, rowconfigure=DEFAULT, columnconfigure=DEFAULT, grid=DEFAULT,
+                       deletecommand=DEFAULT, _placeholder=DEFAULT, _pool_scrollbar=DEFAULT,
+                       bind=Mock(side_effect=bindings.bind),
+                       _add_all=Mock(side_effect=lambda items, **_: [Mock() for _ in items]),
+                       _pool=Mock(side_effect=lambda rows, **_: [MagicMock()
+                                                                 for _ in range(rows)])))
+    for patcher in patchers:
+        patcher.start()
+        test.addCleanup(patcher.stop)
+    return NamedList(None, **kwargs), bindings
+
+class _FakeRoot:
+    """A stand-in for a tkinter app, whose main loop is run by hand."""
+
+    def __init__(self) -> None:
+        """Initialize a new fake app."""
+
+        self.callbacks = []
+
+    def after(self, _ms: int, func: Callable[[], None]) -> None:
+        """Schedule a function to be called by the main loop."""
+
+        self.callbacks.append(func)
+
+    def after_idle(self, func: Callable[[], None]) -> None:
+        """Schedule a function to be called by the main loop, once it's idle."""
+
+        self.callbacks.append(func)
+
+    def run(self, until: Callable[[], bool], limit: int = 100) -> None:
+        """Run the main loop's scheduled callbacks, until a condition is met."""
+
+        for _ in range(limit):
+            if until():
+                return
+            self.callbacks.pop(0)()
+
+class TestAsyncio(unittest.TestCase):
+    """Test the functioning of the asyncio integration."""
+
+    def test_an_asyncio_loop_pumped_by_tkinter_runs_a_coroutine_to_completion(self) -> None:
+        """Confirm that an asyncio loop driven from within tkinter's main loop runs a coroutine to
+        completion."""
+
+        async def coroutine() -> str:
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return 'Done'
+
+        root = _FakeRoot()
+        loop = pump_asyncio(root)
+        self.addCleanup(loop.close)
+        task = loop.create_task(coroutine())
+        root.run(until=task.done)
+        self.assertEqual('Done', task.result())
+
+    @patch('ui.file_chooser', return_value='/path/to/a/file.txt')
+    def test_a_file_choosing_dialog_is_shown_from_within_tkinters_main_loop(
+            self, file_chooser: Mock) -> None:
+        """Confirm that an asynchronous file choosing dialog gets shown from within tkinter's main
+        loop, and resolves to the user-chosen file."""
+
+        root = _FakeRoot()
+        loop = pump_asyncio(root)
+        self.addCleanup(loop.close)
+        task = loop.create_task(afile_chooser(root))
+        root.run(until=task.done)
+        file_chooser.assert_called_once_with()
+        self.assertEqual('/path/to/a/file.txt', task.result())
+
+    @patch('ui.file_chooser', side_effect=OSError('No dialog'))
+    def test_a_file_choosing_dialog_error_is_raised_in_the_awaiting_coroutine(
+            self, _file_chooser: Mock) -> None:
+        """Confirm that an error raised by an asynchronous file choosing dialog gets raised in the
+        coroutine awaiting it, rather than leaving the coroutine pending."""
+
+        root = _FakeRoot()
+        loop = pump_asyncio(root)
+        self.addCleanup(loop.close)
+        task = loop.create_task(afile_chooser(root))
+        root.run(until=task.done)
+        self.assertTrue(task.done())
+        self.assertIsInstance(task.exception(), OSError)
+
+    def test_an_asyncio_loop_stops_being_pumped_once_closed(self) -> None:
+        """Confirm that tkinter's main loop stops driving an asyncio loop once it gets closed."""
+
+        root = _FakeRoot()
+        loop = pump_asyncio(root)
+        loop.close()
+        root.callbacks.pop(0)()
+        self.assertEqual([], root.callbacks)
+
+class TestResponsive(unittest.TestCase):
+    """Test the functioning of a `Responsive` UI."""
+
+    def test_a_responsive_ui_finds_the_breakpoint_of_a_width(self) -> None:
+        """Confirm that a responsive UI finds the breakpoint whose bounds include a certain width,
+        and none for a width outside of all of them."""
+
+        default, medium, large = breakpoints = _breakpoints()
+        responsive = Responsive(breakpoints, app=Mock())
+        for width, breakpoint_ in ((-5, None), (0, default), (800, default), (801, medium),
+                                   (1500, medium), (1501, large), (3500, large), (3501, None)):
+            with self.subTest(width=width):
+                self.assertIs(breakpoint_, responsive._breakpoint(width))
+
+    def test_a_responsive_ui_accepts_breakpoints_in_any_order(self) -> None:
+        """Confirm that a responsive UI finds the right breakpoint when given its breakpoints out of
+        order, or as a generator."""
+
+        default, medium, large = breakpoints = _breakpoints()
+        for breakpoints_ in ((large, default, medium), (bp for bp in breakpoints)):
+            responsive = Responsive(breakpoints_, app=Mock())
+            self.assertIs(default, responsive._breakpoint(400))
+            self.assertIs(medium, responsive._breakpoint(1000))
+            self.assertIs(large, responsive._breakpoint(2000))
+
+    def test_a_responsive_ui_gets_rescaled_once_per_breakpoint(self) -> None:
+        """Confirm that a responsive UI reconfigures its widgets when the app's width crosses into
+        another breakpoint, and not when it's rescaled at the same width or within the same
+        breakpoint."""
+
+        default, medium, _ = breakpoints = _breakpoints()
+        app = Mock()
+        responsive = Responsive(breakpoints, app)
+        app.bind.assert_called_once_with('<Configure>', responsive._schedule_rescale, add='+')
+        app.winfo_width.return_value = 400
+        responsive._rescale()
+        default.specs[0].widget.configure.assert_called_once_with(font=('Futura', 20))
+        responsive._rescale()
+        app.winfo_width.return_value = 500
+        responsive._rescale()
+        default.specs[0].widget.configure.assert_called_once()
+        medium.specs[0].widget.configure.assert_not_called()
+        app.winfo_width.return_value = 1000
+        responsive._rescale()
+        medium.specs[0].widget.configure.assert_called_once_with(font=('Futura', 80))
+
+    @patch('ui.ttk.Style')
+    def test_a_responsive_ui_configures_each_style_once(self, style: Mock) -> None:
+        """Confirm that a responsive UI merges the properties of a breakpoint's specs of the same
+        style, configuring each style just once, along with the breakpoint's widget specs."""
+
+        widget = Mock()
+        breakpoint_ = Breakpoint('default', Bounds(0, 800), (
+            StyleSpec('Title.TLabel', {'font': ('Futura', 20)}),
+            UISpec(widget, {'font': ('Futura', 12)}),
+            StyleSpec('TButton', {'padding': 2}),
+            StyleSpec('Title.TLabel', {'foreground': 'red'})))
+        app = Mock()
+        app.winfo_width.return_value = 400
+        responsive = Responsive((breakpoint_,), app)
+        responsive._rescale()
+        widget.configure.assert_called_once_with(font=('Futura', 12))
+        style.assert_called_with(app)
+        self.assertEqual(
+            [(('Title.TLabel',), {'font': ('Futura', 20), 'foreground': 'red'}),
+             (('TButton',), {'padding': 2})],
+            [(call.args, call.kwargs) for call in style.return_value.configure.call_args_list])
+
+    def test_resizes_in_quick_succession_are_coalesced_into_a_single_rescale(self) -> None:
+        """Confirm that a pending rescale gets replaced, when the app gets resized again."""
+
+        app = Mock()
+        app.after.side_effect = ['job 1', 'job 2']
+        responsive = Responsive(_breakpoints(), app)
+        responsive._schedule_rescale()
+        responsive._schedule_rescale()
+        app.after_cancel.assert_called_once_with('job 1')
+        self.assertEqual(2, app.after.call_count)
+
+class TestNamedList(unittest.TestCase):
+    """Test the functioning of a `NamedList`."""
+
+    def test_items_added_to_a_named_list_before_it_gets_shown_are_queued_up(self) -> None:
+        """Confirm that items added to a named list before it gets shown get their widgets created
+        only once it gets shown, along with the initial items'."""
+
+        named_list, bindings = _named_list(self, items=['Item 1'])
+        named_list.add('Item 2', fg='red')
+        named_list.add_many(['Item 3', 'Item 4'])
+        named_list._add_all.assert_not_called()
+        bindings.fire('<Map>')
+        self.assertEqual([(['Item 1'],), (['Item 2'],), (['Item 3', 'Item 4'],)],
+                         [call.args for call in named_list._add_all.call_args_list])
+        self.assertEqual({'fg': 'red'}, named_list._add_all.call_args_list[1].kwargs)
+        self.assertEqual(4, len(named_list.item_widgets))
+        named_list.placeholder.grid_remove.assert_called_once()
+
+    def test_an_eager_named_list_creates_its_items_widgets_right_away(self) -> None:
+        """Confirm that an eager named list creates its items' widgets upon its creation, without
+        waiting to get shown."""
+
+        named_list, bindings = _named_list(self, items=['Item 1', 'Item 2'], eager=True)
+        named_list._add_all.assert_called_once_with(['Item 1', 'Item 2'])
+        self.assertEqual(2, len(named_list.item_widgets))
+        self.assertEqual({}, bindings.scripts)
+
+    def test_a_named_list_stops_listening_for_getting_shown_once_materialized(self) -> None:
+        """Confirm that a named list drops its own `<Map>` handler once its widgets are created,
+        leaving any other `<Map>` handler bound, and doesn't create them again."""
+
+        named_list, bindings = _named_list(self, items=['Item 1'])
+        named_list.bind('<Map>', Mock(), add='+')
+        own_funcid, other_funcid = bindings.handlers
+        bindings.fire('<Map>')
+        bindings.fire('<Map>')
+        self.assertNotIn(own_funcid, bindings.scripts['<Map>'])
+        self.assertIn(other_funcid, bindings.scripts['<Map>'])
+        named_list.deletecommand.assert_called_once_with(own_funcid)
+        named_list._add_all.assert_called_once()
+
+    def test_removing_all_items_from_a_named_list_discards_the_pending_ones(self) -> None:
+        """Confirm that removing all items from a named list that hasn't been shown yet discards its
+        pending items, rather than creating their widgets."""
+
+        named_list, bindings = _named_list(self, items=['Item 1', 'Item 2'])
+        named_list.remove_all()
+        named_list.add('Item 3')
+        bindings.fire('<Map>')
+        named_list._add_all.assert_called_once_with(['Item 3'])
+        self.assertEqual(1, len(named_list.item_widgets))
+
+    def test_a_virtual_named_list_scrolls_to_a_fraction_of_its_items(self) -> None:
+        """Confirm that a virtual named list scrolls to a fraction of its items when its scrollbar
+        gets dragged, without scrolling past either of its ends."""
+
+        named_list = _named_list(self, items=range(100), virtual=True, rows=10)[0]
+        for fraction, first in (('0.5', 50), ('0', 0), ('-0.2', 0), ('0.95', 90), ('1.5', 90)):
+            with self.subTest(fraction=fraction):
+                named_list._yview('moveto', fraction)
+                self.assertEqual(first, named_list._first)
+
+    def test_a_virtual_named_list_scrolls_by_units_and_pages(self) -> None:
+        """Confirm that a virtual named list scrolls by a row per unit, and by its number of visible
+        rows per page, without scrolling past either of its ends."""
+
+        named_list = _named_list(self, items=range(25), virtual=True, rows=10)[0]
+        for args, first in ((('scroll', '1', 'units'), 1), (('scroll', '1', 'pages'), 11),
+                            (('scroll', '1', 'pages'), 15), (('scroll', '1', 'units'), 15),
+                            (('scroll', '-2', 'units'), 13), (('scroll', '-2', 'pages'), 0),
+                            (('scroll', '-1', 'units'), 0)):
+            with self.subTest(args=args):
+                named_list._yview(*args)
+                self.assertEqual(first, named_list._first)
+
+    def test_a_virtual_named_list_shorter_than_its_rows_does_not_scroll(self) -> None:
+        """Confirm that a virtual named list with fewer items than visible rows stays at its top."""
+
+        named_list = _named_list(self, items=range(3), virtual=True, rows=10)[0]
+        for args in (('scroll', '1', 'units'), ('scroll', '1', 'pages'), ('moveto', '0.9')):
+            with self.subTest(args=args):
+                named_list._yview(*args)
+                self.assertEqual(0, named_list._first)
+        named_list._scroll_to(2)
+        self.assertEqual(0, named_list._first)
+
+    def test_a_virtual_named_list_renders_its_visible_items(self) -> None:
+        """Confirm that a virtual named list shows its visible items in its pool of widgets, and
+        sets its scrollbar to the visible fraction of its items."""
+
+        named_list = _named_list(self, items=[f'Item {i}' for i in range(10)], virtual=True,
+                                 rows=4)[0]
+        self.assertEqual(['Item 0', 'Item 1', 'Item 2', 'Item 3'], _texts(named_list))
+        named_list._scrollbar.set.assert_called_with(0, 0.4)
+        named_list.placeholder.grid_remove.assert_called()
+        named_list._yview('moveto', '0.5')
+        self.assertEqual(['Item 5', 'Item 6', 'Item 7', 'Item 8'], _texts(named_list))
+        named_list._scrollbar.set.assert_called_with(0.5, 0.9)
+
+    def test_a_virtual_named_list_blanks_out_the_rows_past_its_last_item(self) -> None:
+        """Confirm that a virtual named list with fewer items than rows blanks out the rest of its
+        rows, and shows a full scrollbar."""
+
+        named_list = _named_list(self, items=['Item 1', 'Item 2'], virtual=True, rows=4)[0]
+        self.assertEqual(['Item 1', 'Item 2', '', ''], _texts(named_list))
+        named_list._scrollbar.set.assert_called_with(0, 1)
+
+    def test_a_virtual_named_list_shows_its_placeholder_only_while_empty(self) -> None:
+        """Confirm that a virtual named list shows its placeholder while it's empty, and hides it
+        once it gets an item."""
+
+        named_list = _named_list(self, virtual=True, rows=4)[0]
+        self.assertEqual(['', '', '', ''], _texts(named_list))
+        named_list.placeholder.grid.assert_called_once_with()
+        named_list.add('Item 1')
+        self.assertEqual(['Item 1', '', '', ''], _texts(named_list))
+        named_list.placeholder.grid_remove.assert_called_once_with()
+        named_list.remove_all()
+        self.assertEqual(['', '', '', ''], _texts(named_list))
+        self.assertEqual(2, named_list.placeholder.grid.call_count)
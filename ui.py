@@ -5,15 +5,19 @@ widgets.
 .. _tkinter: https://tkdocs.com/shipman/
 """
 
+import asyncio
+import bisect
 import tkinter as tk
-from tkinter import filedialog
-from typing import Dict, Iterable, Tuple
+from tkinter import filedialog, ttk
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
 
 # Widget types
 Widget = tk.Widget
 Frame = tk.Frame
 Label = tk.Label
 Button = tk.Button
+ThemedLabel = ttk.Label    # Styleable in bulk, see `StyleSpec`
+ThemedButton = ttk.Button  # Styleable in bulk, see `StyleSpec`
 
 # Widget positioning options (see https://tkdocs.com/shipman/grid.html)
 FULL_STRETCH = tk.W + tk.E + tk.N + tk.S  # Stretch a widget in both horizontal and vertical
@@ -24,6 +28,9 @@ RIGHT = tk.E                              # Place a widget to the right of its c
 TOP = tk.N                                # Place a widget to the top of its container
 BOTTOM = tk.S                             # Place a widget to the bottom of its container
 
+_PLACEHOLDER_GRID = {'sticky': H_STRETCH}  # The grid options of a list's placeholder
+_SCROLLBAR_STICKY = TOP + BOTTOM + LEFT    # The stickiness of a list's scrollbar
+
 # Widget states
 DISABLED = tk.DISABLED
 NORMAL = tk.NORMAL
@@ -31,6 +38,12 @@ NORMAL = tk.NORMAL
 # Relief styles
 SUNKEN = tk.SUNKEN
 
+# Responsive UI
+RESCALE_DELAY = 16  # Milliseconds to coalesce resize events over (about a frame at 60 Hz)
+
+# asyncio integration
+ASYNCIO_POLL_INTERVAL = 5  # Milliseconds between two runs of an asyncio loop driven by tkinter
+
 def widget(class_: tk.Widget, *args: any, **kwargs: any) -> tk.Widget:
     """Create a GUI widget. The returned widget is actually a tkinter_ widget. All list and keyword
     arguments will be passed to the specific tkinter widget's constructor.
@@ -43,7 +56,7 @@ def widget(class_: tk.Widget, *args: any, **kwargs: any) -> tk.Widget:
     :rtype: tk.Widget
     """
 
-    grid_opts, = _pop(['grid'], from_=kwargs)
+    grid_opts = kwargs.pop('grid', {})
     widget_ = class_(*args, **kwargs)
     widget_.grid(**grid_opts)
     return widget_
@@ -63,8 +76,7 @@ def config(widget_: tk.Widget, opts: dict) -> None:
     :type opts: dict
     """
 
-    for opt, value in opts.items():
-        widget_[opt] = value
+    widget_.configure(**opts)  # All options in a single Tcl call
 
 def file_chooser() -> str:
     """Present a file choosing dialog to the user.
@@ -84,6 +96,104 @@ def file_saver() -> str:
 
     return filedialog.asksaveasfilename()
 
+async def afile_chooser(root: tk.Misc) -> str:
+    """Present a file choosing dialog to the user, without blocking the running asyncio loop. The
+    dialog is shown from within tkinter's main loop, since tkinter isn't to be used from any other
+    thread. The asyncio loop is expected to be driven from within that main loop too, see
+    `pump_asyncio`.
+
+    :param root: Any widget of the app to show the dialog for.
+    :type root: tk.Misc
+    :return: The full path to the user-chosen file.
+    :rtype: str
+    """
+
+    return await _in_main_loop(root, file_chooser)
+
+async def afile_saver(root: tk.Misc) -> str:
+    """Present a file save dialog to the user, without blocking the running asyncio loop. See
+    `afile_chooser`.
+
+    :param root: Any widget of the app to show the dialog for.
+    :type root: tk.Misc
+    :return: The user-selected file save location.
+    :rtype: str
+    """
+
+    return await _in_main_loop(root, file_saver)
+
+def _in_main_loop(root: tk.Misc, func: Callable[[], any]) -> asyncio.Future:
+    """Call a function from within tkinter's main loop, once it's idle, and resolve an asyncio
+    future with the function's result.
+
+    :param root: Any widget of the app whose main loop is to call `func`.
+    :type root: tk.Misc
+    :param func: The function to call.
+    :type func: Callable[[], any]
+    :return: A future of the running asyncio loop, resolved with `func`'s result or exception.
+    :rtype: asyncio.Future
+    """
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(setter: Callable[[any], None], value: any) -> None:
+        """Resolve the future, unless it's been cancelled in the meantime."""
+
+        if not future.done():
+            setter(value)
+
+    def call() -> None:
+        """Call the function, then hand its outcome, whether a result or any error, over to the
+        asyncio loop. An error left unhandled here would leave the awaiting coroutine hanging."""
+
+        try:
+            result = func()
+        except Exception as error:  # pylint: disable=broad-except
+            loop.call_soon_threadsafe(resolve, future.set_exception, error)
+        else:
+            loop.call_soon_threadsafe(resolve, future.set_result, result)
+
+    root.after_idle(call)
+    return future
+
+def pump_asyncio(root: tk.Misc, loop: Optional[asyncio.AbstractEventLoop] = None,
+                 interval: int = ASYNCIO_POLL_INTERVAL) -> asyncio.AbstractEventLoop:
+    """Drive an asyncio event loop from within tkinter's main loop, by running the asyncio loop's
+    ready callbacks every `interval` milliseconds. That lets coroutines, e.g. `afile_chooser`, run
+    alongside the GUI without a thread of their own. The driving stops once the loop gets closed.
+    For example:
+
+    ::
+        loop = pump_asyncio(app)
+        loop.create_task(some_coroutine())
+        app.mainloop()
+
+    :param root: Any widget of the app whose main loop is to drive the asyncio loop.
+    :type root: tk.Misc
+    :param loop: The asyncio loop to drive, defaults to a new one.
+    :type loop: asyncio.AbstractEventLoop, optional
+    :param interval: The time, in milliseconds, between two runs of the asyncio loop, defaults to
+    `ASYNCIO_POLL_INTERVAL`.
+    :type interval: int, optional
+    :return: The driven asyncio loop.
+    :rtype: asyncio.AbstractEventLoop
+    """
+
+    loop = loop or asyncio.new_event_loop()
+
+    def pump() -> None:
+        """Run the asyncio loop's ready callbacks, then schedule the next run."""
+
+        if loop.is_closed():
+            return
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+        root.after(interval, pump)
+
+    root.after(interval, pump)
+    return loop
+
 class StrBinding(tk.StringVar):
     """An object that helps bind a widget's property to a certain textual content. This class is a
     thin wrapper for the tkinter's StringVar_ and it's main purpose is to ease the initialization of
@@ -105,6 +215,8 @@ class StrBinding(tk.StringVar):
 class Bounds:
     """A range of values delimited by a start *(lower)* and an end *(upper)*."""
 
+    __slots__ = ('lower', 'upper')
+
     def __init__(self, lower: int, upper: int) -> None:
         """Initialize a new bound."""
 
@@ -114,12 +226,36 @@ class Bounds:
 class UISpec:
     """A description of a UI widget's desired properties."""
 
+    __slots__ = ('widget', 'props')
+
     def __init__(self, widget_: Widget, props: Dict[str, str]) -> None:
         """"""
 
         self.widget = widget_
         self.props = props
 
+class StyleSpec:
+    """A description of a ttk_ widget style's desired properties. Setting a style's properties
+    applies them to all the widgets of that style at once, e.g. to each `ThemedLabel` created with
+    ``style='Title.TLabel'``.
+
+    .. _ttk: https://tkdocs.com/shipman/ttk.html
+    """
+
+    __slots__ = ('style', 'props')
+
+    def __init__(self, style: str, props: Dict[str, str]) -> None:
+        """Initialize a new style description.
+
+        :param style: The name of the style, e.g. 'Title.TLabel'.
+        :type style: str
+        :param props: The style's properties.
+        :type props: Dict[str, str]
+        """
+
+        self.style = style
+        self.props = props
+
 class Breakpoint:
     """Rules that control what happens to UI widgets when an app's window changes into a certain
     size. Similar to CSS breakpoints_.
@@ -127,53 +263,111 @@ class Breakpoint:
     .. _breakpoints: https://www.w3schools.com/howto/howto_css_media_query_breakpoints.asp
     """
 
+    __slots__ = ('_name', 'bounds', 'specs')
+
     def __init__(
-        self, name: str, bounds: Bounds, specs: Iterable[UISpec]) -> None:
+        self, name: str, bounds: Bounds, specs: Iterable[Union[UISpec, StyleSpec]]) -> None:
         """Initialize a new breakpoint."""
 
         super().__init__()
         self._name = name
         self.bounds = bounds
-        self.specs = specs
+        self.specs = tuple(specs)
 
 class Responsive:
     """A responsive UI. Change UI widgets' properties, like font size, to keep them consisten with
-    their owning app's changing size."""
+    their owning app's changing size.
+
+    The UI gets rescaled when its app gets resized. Resize events that come in quick succession,
+    e.g. while the app's window is being dragged, get coalesced into a single rescale. Widgets are
+    only reconfigured when the app's width crosses into another breakpoint."""
 
     def __init__(self, breakpoints: Iterable[Breakpoint], app: Widget) -> None:
         """Initialize a new responsive UI.
 
         :param widgets: The UI widgets to work on.
         :type widgets: Iterable[Widget]
-        :param breakpoints: The instructions to follow when modifying `widgets`.
+        :param breakpoints: The instructions to follow when modifying `widgets`. The breakpoints'
+        bounds are not expected to overlap (except at their ends).
         :type breakpoints: Iterable[Breakpoint]
         :param app: The *widgets*' owning app.
         :type app: Widget
         """
 
-        self._breakpoints = breakpoints
+        self._breakpoints = tuple(sorted(breakpoints,
+                                         key=lambda breakpoint_: breakpoint_.bounds.lower))
+        self._upper_bounds = tuple(breakpoint_.bounds.upper for breakpoint_ in self._breakpoints)
         self._app = app
+        self._rescale_job = None  # The id of a pending rescale
+        self._last_width = None   # The app's width as of the last rescale
+        self._active_breakpoint = None  # The breakpoint applied by the last rescale
+        app.bind('<Configure>', self._schedule_rescale, add='+')
+
+    def _schedule_rescale(self, _event: tk.Event = None) -> None:
+        """Schedule a rescale of the UI, in place of any still pending one.
+
+        :param _event: The event that has triggered the rescale, if any.
+        :type _event: tk.Event
+        """
+
+        if self._rescale_job is not None:
+            self._app.after_cancel(self._rescale_job)
+        self._rescale_job = self._app.after(RESCALE_DELAY, self._rescale)
 
     def _rescale(self) -> None:
         """Rescale widgets to keep the UI elements' size consistent with the app's current width.
+        """
 
-        :param width: The app's current width.
+        self._rescale_job = None
+        width = self._app.winfo_width()
+        if width == self._last_width:
+            return
+        self._last_width = width
+        breakpoint_ = self._breakpoint(width)
+        if breakpoint_ is self._active_breakpoint:  # The widgets are already set up for this width
+            return
+        self._active_breakpoint = breakpoint_
+        if breakpoint_ is not None:
+            styles = {}  # Style specs' props, merged by style
+            for spec in breakpoint_.specs:
+                if isinstance(spec, StyleSpec):
+                    styles.setdefault(spec.style, {}).update(spec.props)
+                else:
+                    spec.widget.configure(**spec.props)
+            for style, props in styles.items():
+                ttk.Style(self._app).configure(style, **props)
+
+    def _breakpoint(self, width: int) -> Optional[Breakpoint]:
+        """Return the breakpoint whose bounds include a certain width, by a binary search over the
+        breakpoints' upper bounds.
+
+        :param width: The app's width.
         :type width: int
+        :return: The matching breakpoint, or `None` if there isn't one.
+        :rtype: Optional[Breakpoint]
         """
 
-
-        for breakpoint_ in self._breakpoints:
-            if breakpoint_.bounds.lower <= self._app.winfo_width() <= breakpoint_.bounds.upper:
-                for spec in breakpoint_.specs:
-                    for prop, value in spec.props.items():
-                        spec.widget[prop] = value
-                break
+        i = bisect.bisect_left(self._upper_bounds, width)
+        if i < len(self._breakpoints) and self._breakpoints[i].bounds.lower <= width:
+            return self._breakpoints[i]
+        return None
 
 class NamedList(tk.LabelFrame):
-    """A UI widget with a title, and the ability to display items as a list."""
+    """A UI widget with a title, and the ability to display items as a list.
 
+    A *virtual* named list doesn't create a UI widget for each of its items. It keeps a fixed pool
+    of widgets, just enough to fill its visible rows, and updates their text as the list gets
+    scrolled. That keeps long lists cheap to create and to grow.
+
+    A non-virtual named list creates its items' widgets only once it gets shown (mapped) for the
+    first time. Items added before that are queued up along with the initial ones. A list that never
+    gets shown, e.g. one on a tab that's never opened, costs no widgets at all.
+    """
+
+    # pylint: disable-next=too-many-arguments
     def __init__(self, parent: tk.Widget, label: str = 'List', placeholder: str = '<Empty>',
-                 items: list[any] = (), **kwargs):
+                 items: list[any] = (), virtual: bool = False, rows: int = 10, eager: bool = False,
+                 **kwargs):
         """Initialize a new named list.
 
         :param parent: A widget to register this one to.
@@ -184,15 +378,61 @@ class NamedList(tk.LabelFrame):
         :type placeholder: str
         :param items: The list's items.
         :type items: list
+        :param virtual: Whether to only render the items currently in view, defaults to `False`.
+        :type virtual: bool
+        :param rows: The number of visible rows of a virtual list, defaults to 10.
+        :type rows: int
+        :param eager: Whether to create a non-virtual list's item widgets right away, rather than
+        when the list gets shown, defaults to `False`.
+        :type eager: bool
         """
 
-        grid_opts, item_opts = _pop(['grid', 'item_args'], from_=kwargs)
+        grid_opts = kwargs.pop('grid', {})
+        item_opts = kwargs.pop('item_args', {})
         super().__init__(parent, text=label, **kwargs)
         self._make_resizable()
         self.placeholder = self._placeholder(text=placeholder)
-        self.item_widgets = self._add_all(items, **item_opts)
+        self._virtual = virtual
+        if virtual:
+            self._items = list(items)
+            self._first = 0  # The index of the first visible item
+            self.item_widgets = self._pool(rows, **item_opts)
+            self._scrollbar = self._pool_scrollbar(rows)
+            self._render()
+        else:
+            self.item_widgets = []
+            # Batches of items, along with their widgets' options, whose widgets are yet to be
+            # created. `None` once the list has been materialized.
+            self._pending_items = [(list(items), item_opts)]
+            self._map_funcid = None
+            if eager:  # Populated before it's laid out (gridded), so it's laid out just once
+                self._materialize()
+            else:
+                self._map_funcid = self.bind('<Map>', self._materialize, add='+')
         self.grid(**grid_opts)
 
+    def _materialize(self, _event: tk.Event = None) -> None:
+        """Create the UI widgets of a non-virtual list's pending items, unless already created.
+
+        :param _event: The event that has triggered the creation, if any.
+        :type _event: tk.Event
+        """
+
+        if self._pending_items is None:
+            return
+        batches, self._pending_items = self._pending_items, None
+        if self._map_funcid is not None:
+            # Drop just this list's own handler, `unbind` would drop any other `<Map>` one too
+            script = '\n'.join(line for line in self.bind('<Map>').splitlines()
+                               if self._map_funcid not in line)
+            self.bind('<Map>', script)
+            self.deletecommand(self._map_funcid)
+            self._map_funcid = None
+        for items, opts in batches:
+            self.item_widgets.extend(self._add_all(items, **opts))
+        if self.item_widgets:
+            self.placeholder.grid_remove()
+
     def _make_resizable(self) -> None:
         """Make this app's window resizable."""
 
@@ -205,33 +445,164 @@ class NamedList(tk.LabelFrame):
         :param item: The item to add.
         :type item: any
         :param kwargs: Keyword arguments to pass onto the `ui.widget` function for creating the UI
-        widget.
+        widget. Ignored by a virtual list, its widgets are created upfront.
         :type kwargs: any
         """
 
+        if self._virtual:
+            self._items.append(item)
+            self._render()
+            return
+        if self._pending_items is not None:
+            self._pending_items.append(([item], kwargs))
+            return
         if not self.item_widgets:
-            self.placeholder.grid_forget()
-            self.placeholder = None
+            self.placeholder.grid_remove()
         self.item_widgets.append(widget(Label, self, text=str(item), **kwargs))
 
+    def add_many(self, items: list[any], **kwargs: any) -> None:
+        """Add a number of items to the list at once. A virtual list gets re-rendered just once,
+        instead of once per item.
+
+        :param items: The items to add.
+        :type items: list
+        :param kwargs: Keyword arguments to pass onto the `ui.widget` function for creating the UI
+        widgets. Ignored by a virtual list, its widgets are created upfront.
+        :type kwargs: any
+        """
+
+        if self._virtual:
+            self._items.extend(items)
+            self._render()
+            return
+        if self._pending_items is not None:
+            self._pending_items.append((list(items), kwargs))
+            return
+        new_widgets = self._add_all(items, **kwargs)
+        if new_widgets and not self.item_widgets:
+            self.placeholder.grid_remove()
+        self.item_widgets.extend(new_widgets)
+
     def remove_all(self) -> None:
         """Remove all items from the list."""
 
+        if self._virtual:
+            self._items = []
+            self._first = 0
+            self._render()
+            return
+        if self._pending_items is not None:  # Not shown yet, there are no widgets to remove
+            self._pending_items = []
+            return
         for widget_ in self.item_widgets:
             widget_.grid_forget()
         self.item_widgets = []
+        self.placeholder.grid()
 
-    def _add_all(self, items: list[any], **kwargs) -> None:
-        """Create a UI widget for each of the items on the `list`.
+    def _add_all(self, items: list[any], **kwargs) -> list[tk.Widget]:
+        """Create a UI widget for each of the items on the `list`. Same as calling the `ui.widget`
+        function for each item, minus the per-item call overhead.
 
         :param items: The list of items.
         :type items: list
         :param kwargs: Keyword arguments to pass onto the `ui.widget` function for creating the UI
         widget.
         :type kwargs: any
+        :return: The created UI widgets.
+        :rtype: list[tk.Widget]
+        """
+
+        grid_opts = kwargs.pop('grid', {})
+        widgets = []
+        for text in map(str, items):
+            widget_ = Label(self, text=text, **kwargs)
+            widget_.grid(**grid_opts)
+            widgets.append(widget_)
+        return widgets
+
+    def _pool(self, rows: int, **kwargs) -> list[tk.Widget]:
+        """Create the fixed set of UI widgets a virtual list displays its visible items with.
+
+        :param rows: The number of widgets, one per visible row.
+        :type rows: int
+        :param kwargs: Keyword arguments to pass onto the `ui.widget` function for creating the UI
+        widgets.
+        :type kwargs: any
+        :return: The UI widgets.
+        :rtype: list[tk.Widget]
+        """
+
+        grid_opts = kwargs.pop('grid', {})
+        pool = [widget(Label, self, text='', grid={**grid_opts, 'row': row + 1, 'column': 0},
+                       **kwargs) for row in range(rows)]
+        for widget_ in (self, *pool):
+            for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                widget_.bind(sequence, self._on_mousewheel, add='+')
+        return pool
+
+    def _pool_scrollbar(self, rows: int) -> tk.Scrollbar:
+        """Construct the scrollbar of a virtual list.
+
+        :param rows: The number of the list's visible rows.
+        :type rows: int
+        :return: A scrollbar widget.
+        :rtype: tk.Scrollbar
+        """
+
+        scrollbar = widget(tk.Scrollbar, self, orient=tk.VERTICAL,
+                           grid={'row': 0, 'column': 1, 'rowspan': rows + 1,
+                                 'sticky': _SCROLLBAR_STICKY})
+        scrollbar['command'] = self._yview
+        return scrollbar
+
+    def _yview(self, *args: str) -> None:
+        """Scroll a virtual list. Takes the arguments a scrollbar passes onto its command, e.g.
+        ``('moveto', '0.5')`` or ``('scroll', '1', 'units')``.
+        """
+
+        if args[0] == 'moveto':
+            first = round(float(args[1]) * len(self._items))
+        else:
+            first = self._first + int(args[1]) * (len(self.item_widgets)
+                                                  if args[2] == 'pages' else 1)
+        self._scroll_to(first)
+
+    def _on_mousewheel(self, event: tk.Event) -> None:
+        """Scroll a virtual list by a row in response to the mouse wheel.
+
+        :param event: The mouse wheel event.
+        :type event: tk.Event
+        """
+
+        self._scroll_to(self._first + (-1 if event.num == 4 or event.delta > 0 else 1))
+
+    def _scroll_to(self, first: int) -> None:
+        """Scroll a virtual list, so that a certain item is at its top.
+
+        :param first: The index of the item to show at the top.
+        :type first: int
         """
 
-        return [widget(Label, self, text=str(item), **kwargs) for item in items]
+        self._first = max(0, min(first, len(self._items) - len(self.item_widgets)))
+        self._render()
+
+    def _render(self) -> None:
+        """Show a virtual list's currently visible items in its pool of UI widgets."""
+
+        rows = len(self.item_widgets)
+        count = len(self._items)
+        texts = list(map(str, self._items[self._first:self._first + rows]))
+        texts.extend('' for _ in range(rows - len(texts)))  # Blank out the rows past the last item
+        for widget_, text in zip(self.item_widgets, texts):
+            widget_['text'] = text
+        if count:
+            self.placeholder.grid_remove()
+        else:
+            self.placeholder.grid()
+        if count > rows:
+            self._scrollbar.set(self._first / count, (self._first + rows) / count)
+        else:
+            self._scrollbar.set(0, 1)
 
     def _placeholder(self, text: str) -> tk.Widget:
         """Display a placeholder text, typically when the list is empty.
@@ -242,27 +613,7 @@ class NamedList(tk.LabelFrame):
         :rtype: tk.Widget
         """
 
-        return widget(Label, self, text=text, state=DISABLED, grid={'sticky': H_STRETCH})
-
-def _pop(items: list[str], from_: dict) -> tuple:
-    """Pop a value(s) off a dictionary and return them as a tuple. For example the following pop two
-    of the values from a dictionary, key'd 'key1' and 'key2':
-
-    >>> key1, key2 = _pop(
-            items=['key1', 'key2'],
-            from_={'key1': 'value1', 'key2': 'value2', 'key3': 'value3'}
-        )
-    >>> ('value1', 'value2')
-
-    :param items: A list of keys to pop off `from_`.
-    :type items: list[str]
-    :param from_: The dictionary to pop items off.
-    :type from_: dict
-    :return: A tuple of the values of the popped dictionary keys.
-    :rtype: tuple
-    """
-
-    return tuple(from_.pop(key) for key in items)
+        return widget(Label, self, text=text, state=DISABLED, grid=_PLACEHOLDER_GRID)
 
 class List(tk.Listbox):
     """A UI widget that displays items as a list."""
@@ -281,19 +632,14 @@ class List(tk.Listbox):
         """
 
         self._items = list(items)
-        self._list = StrBinding(' '.join(self._items))
-        grid_opts, scroll_grid_opts = _pop(['grid', 'scroll_grid'] ,from_=kwargs)
+        grid_opts = kwargs.pop('grid', {})
+        scroll_grid_opts = kwargs.pop('scroll_grid', {})
         scrollbar_grid_opts = self._scrollbar_grid_opts(grid_opts, scroll_grid_opts)
         scrollbar = self._scrollbar(parent, **scrollbar_grid_opts)
-        super().__init__(parent, listvariable=self._list,
-                         yscrollcommand=scrollbar.set, **kwargs)
+        super().__init__(parent, yscrollcommand=scrollbar.set, **kwargs)
+        self.insert(tk.END, *self._items)  # All items in a single call, before being laid out
         self.grid(**grid_opts)
 
-    def _update_binding(self) -> None:
-        """Update the internal binding object, supplying the list with items."""
-
-        self._list.set(' '.join(self._items))
-
     def _scrollbar_grid_opts(self, list_grid_opts: dict, scroll_grid_opts: dict) -> dict:
         """Return a complete dictionary of this `List`'s scrollbar's grid options.
 
@@ -319,7 +665,7 @@ class List(tk.Listbox):
         """
 
         scrollbar = widget(tk.Scrollbar, parent, orient=tk.VERTICAL,
-                           grid={**grid_opts, **{'sticky': TOP + BOTTOM + LEFT}})
+                           grid={**grid_opts, 'sticky': _SCROLLBAR_STICKY})
         scrollbar['command'] = self.yview
         return scrollbar
 
@@ -331,7 +677,18 @@ class List(tk.Listbox):
         """
 
         self._items.append(item)
-        self._update_binding()
+        self.insert(tk.END, item)
+
+    def add_many(self, items: list[str]) -> None:
+        """Add a number of items to the list at once. The items are passed to the underlying
+        tkinter Listbox in a single call.
+
+        :param items: The items to add.
+        :type items: list[str]
+        """
+
+        self._items.extend(items)
+        self.insert(tk.END, *items)
 
     def get_all(self) -> list[str]:
         """Return all of this list's items.
@@ -346,7 +703,7 @@ class List(tk.Listbox):
         """Remove all items from the list."""
 
         self._items = []
-        self._list.set('')
+        self.delete(0, tk.END)
 
 class OptionMenu(tk.OptionMenu):
     """A list of selectable options."""
@@ -370,7 +727,7 @@ class OptionMenu(tk.OptionMenu):
 
         self._value = biniding
         self._value.set(options[0])
-        grid_opts = _pop(['grid'] ,from_=kwargs)[0]
+        grid_opts = kwargs.pop('grid', {})
         super().__init__(parent, self._value, *options, **kwargs)
         self.grid(**grid_opts)
 